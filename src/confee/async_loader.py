@@ -61,6 +61,8 @@ class AsyncConfigLoader:
 
         import yaml
 
+        from .loaders import _YamlSafeLoader
+
         async with aiohttp.ClientSession() as session:
             async with session.get(
                 url, timeout=aiohttp.ClientTimeout(total=timeout), headers=headers
@@ -72,11 +74,11 @@ class AsyncConfigLoader:
                 if "json" in content_type or url.endswith(".json"):
                     return json.loads(content)
                 if "yaml" in content_type or url.endswith((".yaml", ".yml")):
-                    return yaml.safe_load(content)
+                    return yaml.load(content, Loader=_YamlSafeLoader)  # nosec B506
 
                 # Try YAML first (superset of JSON)
                 try:
-                    return yaml.safe_load(content)
+                    return yaml.load(content, Loader=_YamlSafeLoader)  # nosec B506
                 except yaml.YAMLError:
                     return json.loads(content)
 
@@ -1,5 +1,6 @@
 """Configuration base classes with Pydantic validation and inheritance support."""
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, ClassVar, Dict, FrozenSet, List, Set, Type, TypeVar
 from weakref import WeakValueDictionary
@@ -258,7 +259,8 @@ class ConfigBase(BaseModel):
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Override setattr to enforce frozen state."""
-        if hasattr(self, "__dict__") and id(self) in ConfigBase._frozen_instances:
+        # Pydantic models always carry a __dict__ slot, so only the frozen registry is checked
+        if id(self) in ConfigBase._frozen_instances:
             raise AttributeError(
                 "Cannot modify frozen configuration. Call .unfreeze() first to make it mutable."
             )
@@ -281,6 +283,7 @@ class ConfigBase(BaseModel):
         source_order: List[str] | None = None,
         help_flags: List[str] | None = None,
         strict: bool = True,
+        env: Mapping[str, str] | None = None,
     ) -> T:
         """Load configuration from multiple sources (file, environment, CLI).
 
@@ -294,6 +297,7 @@ class ConfigBase(BaseModel):
             source_order: Parsing order (default: ["env", "file"])
             help_flags: Help flags (default: ["--help", "-h"])
             strict: If True, forbid extra fields; if False, ignore extra fields (default: True)
+            env: Environment mapping to read instead of os.environ (default: os.environ)
 
         Returns:
             Configuration instance
@@ -327,6 +331,7 @@ class ConfigBase(BaseModel):
                 source_order=source_order,
                 help_flags=help_flags,
                 strict=strict,
+                env=env,
             )
             config.print()
             return config
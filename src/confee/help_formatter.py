@@ -280,7 +280,9 @@ class HelpFormatter:
         help_text += f"  {Color.GREEN}key=value{Color.RESET}              Set a simple value\n"
         help_text += f"  {Color.GREEN}nested.key=value{Color.RESET}       Set a nested value\n"
         help_text += f"  {Color.GREEN}@file:path/to/file{Color.RESET}     Read value from file\n"
-        help_text += f"  {Color.GREEN}true/false/yes/no/on/off{Color.RESET} for boolean values\n"
+        help_text += (
+            f"  {Color.GREEN}true/false/yes/no/on/off/t/f/y/n{Color.RESET} for boolean values\n"
+        )
         help_text += f"\n{Color.BOLD}{Color.BRIGHT_CYAN}Examples:{Color.RESET}\n"
         help_text += f"  {Color.MAGENTA}{program_name} debug=true workers=8{Color.RESET}\n"
         help_text += f"  {Color.MAGENTA}{program_name} --help{Color.RESET}\n"
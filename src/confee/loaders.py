@@ -1,8 +1,9 @@
 """Configuration loaders for YAML, JSON, TOML and other formats."""
 
+import copy
 import json
 from pathlib import Path
-from typing import Any, Dict, Type, TypeVar
+from typing import Any, Dict, Tuple, Type, TypeVar
 
 import yaml
 
@@ -26,6 +27,17 @@ except ImportError:
     pass
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it (much faster parsing)
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+# Parsed YAML files: absolute path -> ((st_mtime_ns, st_size, st_ino), data).
+# Callers always receive a deep copy, so in-place merges never leak into the cache.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+
 class ConfigLoader:
     """Flexible configuration file loader with automatic format detection.
 
@@ -66,19 +78,39 @@ class ConfigLoader:
 
     @staticmethod
     def load_yaml(file_path: str | Path) -> Dict[str, Any]:
-        """Load YAML configuration file."""
+        """Load YAML configuration file.
+
+        Parsed files are cached by (mtime, size, inode), so repeated loads of an
+        unchanged file skip YAML parsing and only pay for a stat and a deep copy.
+        """
         path = Path(file_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Config file not found: {file_path}")
 
+        cache_key = str(path.absolute())
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return copy.deepcopy(cached[1])
+
         with open(path, encoding="utf-8") as f:
             try:
-                data = yaml.safe_load(f)
-                # YAML can return None for empty files
-                return data if isinstance(data, dict) else ({} if data is None else {})
+                data = yaml.load(f, Loader=_YamlSafeLoader)  # nosec B506
             except yaml.YAMLError as e:
                 raise ValueError(f"Invalid YAML file: {file_path}\nError: {e}")
 
+        # YAML can return None for empty files
+        data = data if isinstance(data, dict) else {}
+        _YAML_CACHE[cache_key] = (signature, data)
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached parsed YAML files."""
+        _YAML_CACHE.clear()
+
     @staticmethod
     def load_json(file_path: str | Path) -> Dict[str, Any]:
         """Load JSON configuration file."""
@@ -184,7 +216,7 @@ class ConfigLoader:
             if "json" in content_type or url.endswith(".json"):
                 return json.loads(content)
             elif "yaml" in content_type or url.endswith((".yaml", ".yml")):
-                return yaml.safe_load(content)
+                return yaml.load(content, Loader=_YamlSafeLoader)  # nosec B506
             elif "toml" in content_type or url.endswith(".toml"):
                 if not _toml_available or tomllib is None:
                     raise ImportError("TOML support requires Python 3.11+ or 'tomli' package")
@@ -192,7 +224,7 @@ class ConfigLoader:
             else:
                 # Try YAML first (superset of JSON)
                 try:
-                    return yaml.safe_load(content)
+                    return yaml.load(content, Loader=_YamlSafeLoader)  # nosec B506
                 except Exception:
                     return json.loads(content)
 
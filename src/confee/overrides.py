@@ -1,8 +1,14 @@
 """Command-line argument and environment variable override handling."""
 
+import functools
 import os
 import sys
-from typing import Any, Dict, List, Literal, Tuple, Type, TypeVar
+import types
+import typing
+from collections.abc import Callable, Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, FrozenSet, List, Literal, Tuple, Type, TypeVar
 
 # Import from new modular components
 from .colors import Color
@@ -12,6 +18,8 @@ from .help_formatter import HelpFormatter
 
 T = TypeVar("T", bound=ConfigBase)
 
+# Environment mapping installed by OverrideHandler.with_env() for the current context
+_ACTIVE_ENV: ContextVar[Mapping[str, str] | None] = ContextVar("confee_active_env", default=None)
 
 # Re-export for backward compatibility
 __all__ = [
@@ -23,6 +31,116 @@ __all__ = [
 ]
 
 
+_BOOL_TRUE = frozenset({"true", "yes", "1", "on", "y", "t"})
+_BOOL_FALSE = frozenset({"false", "no", "0", "off", "n", "f"})
+
+
+def _coerce_bool(value: str) -> bool:
+    """Coerce a string to bool using the accepted true/false tokens."""
+    value_lower = value.strip().lower()
+    if value_lower in _BOOL_TRUE:
+        return True
+    if value_lower in _BOOL_FALSE:
+        return False
+    raise ValueError(
+        f"Cannot coerce '{value}' to bool. Use: true/yes/on/y/t/1 or false/no/off/n/f/0"
+    )
+
+
+# String coercion per target type; other types fall back to calling the type itself
+_COERCERS: Dict[type, Callable[[str], Any]] = {
+    bool: _coerce_bool,
+    int: int,
+    float: float,
+    str: str,
+}
+
+# Field types whose override values are converted before validation; anything else
+# (including str) is passed through as-is. bool comes first as it subclasses int.
+_CONVERTED_TYPES = (bool, int, float)
+
+# Field plan entry: (coercer or None, nested ConfigBase class or None)
+_FieldSpec = Tuple[Callable[[str], Any] | None, Type[ConfigBase] | None]
+
+
+@functools.cache
+def _field_plan(config_class: Type[ConfigBase]) -> Dict[str, _FieldSpec]:
+    """Build (once per class) the coercion plan used by apply_overrides.
+
+    Optional[X] annotations are unwrapped to X so that fields defaulting to None
+    are still coerced to their declared type.
+    """
+    plan: Dict[str, _FieldSpec] = {}
+
+    for name, field in config_class.model_fields.items():
+        annotation = field.annotation
+        if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if len(args) == 1:
+                annotation = args[0]
+
+        coercer = None
+        nested_class = None
+        if isinstance(annotation, type) and annotation in _CONVERTED_TYPES:
+            coercer = _COERCERS[annotation]
+        elif isinstance(annotation, type) and issubclass(annotation, ConfigBase):
+            nested_class = annotation
+
+        plan[name] = (coercer, nested_class)
+
+    return plan
+
+
+@functools.cache
+def _accepted_top_level_keys(config_class: Type[ConfigBase]) -> FrozenSet[str] | None:
+    """Return the top-level keys a config class can consume, computed once per class.
+
+    Includes field names and string aliases. Returns None when a field uses an
+    AliasPath/AliasChoices validation alias, or when a before/wrap model validator
+    may remap raw keys, since the accepted keys are then not a simple set of names.
+    """
+    if _has_raw_input_validator(config_class):
+        return None
+
+    keys = set()
+
+    for name, field in config_class.model_fields.items():
+        keys.add(name)
+        if field.alias is not None:
+            keys.add(field.alias)
+        if field.validation_alias is not None:
+            if not isinstance(field.validation_alias, str):
+                return None
+            keys.add(field.validation_alias)
+
+    return frozenset(keys)
+
+
+def _has_raw_input_validator(config_class: Type[ConfigBase]) -> bool:
+    """Check whether a before/wrap model validator sees the raw top-level input."""
+    validators = config_class.__pydantic_decorators__.model_validators.values()
+    return any(validator.info.mode in ("before", "wrap") for validator in validators)
+
+
+def _infer_coercer(current_value: Any) -> Callable[[str], Any] | None:
+    """Infer the coercer from an existing value (for fields without a plan)."""
+    for target_type in _CONVERTED_TYPES:
+        if isinstance(current_value, target_type):
+            return _COERCERS[target_type]
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _env_key_to_config_key(env_key: str) -> str:
+    """Convert a prefix-stripped env var name to a config key.
+
+    Double underscores become dots for nested config support,
+    e.g. DATABASE__HOST -> database.host and A___B -> a._b. Results are interned
+    so repeated scans share one string per key.
+    """
+    return sys.intern(env_key.lower().replace("__", "."))
+
+
 def is_help_command(
     arg: str,
     help_flags: List[str] | None = None,
@@ -63,15 +181,16 @@ class OverrideHandler:
             Tuple of (key, value)
 
         Raises:
-            ValueError: If format is invalid
+            ValueError: If format is invalid (no "=" or an empty key)
         """
-        if "=" not in override_str:
+        key, sep, value = override_str.partition("=")
+        key = key.strip()
+        if not sep or not key:
             raise ValueError(
                 f"Invalid override format: '{override_str}'. Expected format: key=value"
             )
 
-        key, value = override_str.split("=", 1)
-        return key.strip(), value.strip()
+        return key, value.strip()
 
     @staticmethod
     def parse_overrides(
@@ -93,24 +212,23 @@ class OverrideHandler:
             >>> overrides
             {'debug': 'true', 'workers': '8'}
         """
-        overrides: Dict[str, Any] = {}
-
-        for override_str in override_strings:
-            key, value = OverrideHandler.parse_override_string(override_str)
-            overrides[key] = value
-
-        return overrides
+        return dict(map(OverrideHandler.parse_override_string, override_strings))
 
     @staticmethod
     def get_env_overrides(
-        prefix: str = "CONFEE_",
+        prefix: str | Tuple[str, ...] = "CONFEE_",
         strict: bool = False,
+        env: Mapping[str, str] | None = None,
     ) -> Dict[str, str]:
         """Get configuration overrides from environment variables.
 
         Args:
-            prefix: Environment variable prefix (default: CONFEE_)
+            prefix: Environment variable prefix (default: CONFEE_). A tuple of prefixes
+                    may be given; each variable is stripped of the first prefix it matches.
             strict: If True, only variables with prefix are used
+            env: Environment mapping to scan (default: the mapping installed by
+                 with_env(), else os.environ). Pass a snapshot such as
+                 dict(os.environ) to reuse one read across several lookups.
 
         Returns:
             Dictionary of environment-based overrides
@@ -120,26 +238,64 @@ class OverrideHandler:
             >>> overrides = OverrideHandler.get_env_overrides()
             >>> overrides
             {'debug': 'true', 'workers': '8'}
+
+            # Environment: MYAPP_DEBUG=true LEGACY_WORKERS=8
+            >>> OverrideHandler.get_env_overrides(prefix=("MYAPP_", "LEGACY_"))
+            {'debug': 'true', 'workers': '8'}
         """
+        prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix)
+        if env is None:
+            env = _ACTIVE_ENV.get()
+            if env is None:
+                env = os.environ
+        single_plen = len(prefixes[0]) if len(prefixes) == 1 else None
+
         env_overrides: Dict[str, str] = {}
 
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                config_key = key[len(prefix) :].lower()
-                # Convert double underscore to dot for nested config support
-                # e.g., MYAPP_DATABASE__HOST -> database.host
-                config_key = config_key.replace("__", ".")
-                env_overrides[config_key] = value
+        for key, value in env.items():
+            if not key.startswith(prefixes):
+                continue
+            plen = single_plen
+            if plen is None:
+                plen = len(next(p for p in prefixes if key.startswith(p)))
+            env_overrides[_env_key_to_config_key(key[plen:])] = value
 
         return env_overrides
 
+    @staticmethod
+    @contextmanager
+    def with_env(env: Mapping[str, str]) -> Generator[Mapping[str, str], None, None]:
+        """Use a mapping instead of os.environ for env lookups within a block.
+
+        The mapping is stored in a context variable, so concurrent threads and
+        asyncio tasks can each build configs from their own environment without
+        touching os.environ.
+
+        Args:
+            env: Environment mapping (e.g. {"MYAPP_DEBUG": "true"})
+
+        Yields:
+            The given mapping
+
+        Examples:
+            >>> with OverrideHandler.with_env({"MYAPP_WORKERS": "8"}):
+            ...     config = OverrideHandler.parse(AppConfig, env_prefix="MYAPP_")
+            >>> config.workers
+            8
+        """
+        token = _ACTIVE_ENV.set(env)
+        try:
+            yield env
+        finally:
+            _ACTIVE_ENV.reset(token)
+
     @staticmethod
     def coerce_value(value: str, target_type: Type[Any]) -> Any:
         """Coerce string value to target type.
 
         Supports special handling for boolean values:
-        - True: "true", "yes", "1", "on" (case-insensitive)
-        - False: "false", "no", "0", "off" (case-insensitive)
+        - True: "true", "yes", "1", "on", "y", "t" (case-insensitive)
+        - False: "false", "no", "0", "off", "n", "f" (case-insensitive)
 
         Args:
             value: String value to coerce
@@ -158,25 +314,11 @@ class OverrideHandler:
             >>> OverrideHandler.coerce_value("42", int)
             42
         """
-        if target_type == bool:
-            value_lower = value.lower().strip()
-            if value_lower in {"true", "yes", "1", "on"}:
-                return True
-            elif value_lower in {"false", "no", "0", "off"}:
-                return False
-            else:
-                raise ValueError(
-                    f"Cannot coerce '{value}' to bool. Use: true/yes/on/1 or false/no/off/0"
-                )
-        elif target_type == int:
-            return int(value)
-        elif target_type == float:
-            return float(value)
-        elif target_type == str:
-            return value
-        else:
-            # Try direct conversion
-            return target_type(value)
+        coercer = _COERCERS.get(target_type)
+        if coercer is not None:
+            return coercer(value)
+        # Try direct conversion
+        return target_type(value)
 
     @staticmethod
     def apply_overrides(
@@ -195,6 +337,7 @@ class OverrideHandler:
 
         Returns:
             New configuration instance with overrides applied
+            (the given instance itself when there are no overrides and it is not frozen)
 
         Examples:
             >>> config = AppConfig(name="myapp", debug=False)
@@ -209,52 +352,44 @@ class OverrideHandler:
             >>> config.database.host
             'localhost'
         """
+        if not overrides and not config_instance.is_frozen():
+            return config_instance
+
         config_dict = config_instance.model_dump()
+        root_plan = _field_plan(type(config_instance))
 
         for key, value in overrides.items():
             # Nested field support (a.b.c format)
-            if "." in key:
-                parts = key.split(".")
-                current = config_dict
-
-                # Navigate until the penultimate part
-                for part in parts[:-1]:
-                    if part not in current:
-                        if strict:
-                            raise KeyError(f"Unknown configuration key: {key}")
-                        continue
-                    current = current[part]
-
-                # Set the value at the last part
-                last_key = parts[-1]
-                if last_key in current:
-                    # Coerce based on the type of the existing value
-                    if isinstance(current[last_key], bool):
-                        current[last_key] = OverrideHandler.coerce_value(value, bool)
-                    elif isinstance(current[last_key], int):
-                        current[last_key] = OverrideHandler.coerce_value(value, int)
-                    elif isinstance(current[last_key], float):
-                        current[last_key] = OverrideHandler.coerce_value(value, float)
-                    else:
-                        current[last_key] = value
-                elif strict:
-                    raise KeyError(f"Unknown configuration key: {key}")
-            else:
-                # Top-level field
-                if key not in config_dict and strict:
-                    raise KeyError(f"Unknown configuration key: {key}")
-
-                if key in config_dict:
-                    # Coerce value based on current value type
-                    if isinstance(config_dict[key], bool):
-                        config_dict[key] = OverrideHandler.coerce_value(value, bool)
-                    elif isinstance(config_dict[key], int):
-                        config_dict[key] = OverrideHandler.coerce_value(value, int)
-                    elif isinstance(config_dict[key], float):
-                        config_dict[key] = OverrideHandler.coerce_value(value, float)
-                    else:
-                        config_dict[key] = value
-
+            parts = key.split(".")
+            current: Any = config_dict
+            plan: Dict[str, _FieldSpec] | None = root_plan
+
+            # Navigate until the penultimate part
+            for part in parts[:-1]:
+                if not isinstance(current, dict) or part not in current:
+                    if strict:
+                        raise KeyError(f"Unknown configuration key: {key}")
+                    continue
+                current = current[part]
+                spec = plan.get(part) if plan is not None else None
+                nested_class = spec[1] if spec is not None else None
+                plan = _field_plan(nested_class) if nested_class is not None else None
+
+            # Set the value at the last part
+            last_key = parts[-1]
+            if isinstance(current, dict) and last_key in current:
+                spec = plan.get(last_key) if plan is not None else None
+                coercer = spec[0] if spec is not None else None
+                if coercer is None:
+                    # Fall back to the type of the existing value (e.g. Dict/Any fields)
+                    coercer = _infer_coercer(current[last_key])
+
+                current[last_key] = coercer(value) if coercer is not None else value
+            elif strict:
+                raise KeyError(f"Unknown configuration key: {key}")
+
+        # Rebuild once so all overrides go through validation in a single pass.
+        # model_copy(update=...) would be cheaper but skips validation entirely.
         return config_instance.__class__(**config_dict)
 
     @staticmethod
@@ -322,25 +457,23 @@ class OverrideHandler:
         nested: Dict[str, Any] = {}
 
         for key, value in flat_dict.items():
-            if "." not in key:
-                if key in nested and isinstance(nested[key], dict):
-                    raise ValueError(f"Cannot set '{key}' to scalar value: nested keys exist")
-                nested[key] = value
-            else:
-                parts = key.split(".")
-                current = nested
-
-                for i, part in enumerate(parts[:-1]):
-                    if part not in current:
-                        current[part] = {}
-                    elif not isinstance(current[part], dict):
-                        path_so_far = ".".join(parts[: i + 1])
-                        raise ValueError(
-                            f"Cannot create nested key '{key}': '{path_so_far}' is not a dict"
-                        )
-                    current = current[part]
-
-                current[parts[-1]] = value
+            # Interned segments compare by identity against interned field names
+            *parents, last_key = map(sys.intern, key.split("."))
+            current = nested
+
+            for i, part in enumerate(parents):
+                if part not in current:
+                    current[part] = {}
+                elif not isinstance(current[part], dict):
+                    path_so_far = ".".join(parents[: i + 1])
+                    raise ValueError(
+                        f"Cannot create nested key '{key}': '{path_so_far}' is not a dict"
+                    )
+                current = current[part]
+
+            if not parents and isinstance(current.get(last_key), dict):
+                raise ValueError(f"Cannot set '{key}' to scalar value: nested keys exist")
+            current[last_key] = value
 
         return nested
 
@@ -350,13 +483,58 @@ class OverrideHandler:
         override: Dict[str, Any],
     ) -> Dict[str, Any]:
         result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = OverrideHandler._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                existing = target.get(key)
+                if isinstance(value, dict) and isinstance(existing, dict):
+                    # Copy the nested level before merging so base is never mutated
+                    target[key] = existing = existing.copy()
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
         return result
 
+    @staticmethod
+    def _deep_merge_inplace(
+        base: Dict[str, Any],
+        override: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Merge override into base in place and return base.
+
+        Nested dicts of base are mutated, so only use this on dicts owned by the caller.
+        """
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                existing = target.get(key)
+                if isinstance(value, dict) and isinstance(existing, dict):
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
+        return base
+
+    @staticmethod
+    def _fold_sources(sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold flat/dotted source dicts, lowest priority first, into one nested dict.
+
+        Each source is flattened once. The first non-empty one becomes the
+        accumulator and the rest are merged into it in place, so the sources must
+        be dicts owned by the caller.
+        """
+        merged: Dict[str, Any] | None = None
+        for source in sources:
+            if not source:
+                continue
+            nested = OverrideHandler._flatten_to_nested(source)
+            if merged is None:
+                merged = nested
+            else:
+                OverrideHandler._deep_merge_inplace(merged, nested)
+        return merged if merged is not None else {}
+
     @staticmethod
     def parse(
         config_class: Type[T],
@@ -366,6 +544,7 @@ class OverrideHandler:
         source_order: List[str] | None = None,
         help_flags: List[str] | None = None,
         strict: bool = True,
+        env: Mapping[str, str] | None = None,
     ) -> T:
         """Parse configuration from multiple sources (file, environment, CLI).
 
@@ -382,6 +561,9 @@ class OverrideHandler:
                          Available: ["file", "env", "cli"]
             help_flags: Help command flags. Default: ["--help", "-h"]
             strict: If True, forbid extra fields and raise errors on validation failure
+            env: Environment mapping to read instead of os.environ (also used for
+                 CONFEE_VERBOSITY/NO_COLOR). Default: the mapping installed by
+                 with_env(), else os.environ
 
         Returns:
             Configuration instance
@@ -425,10 +607,19 @@ class OverrideHandler:
         if help_flags is None:
             help_flags = ["--help", "-h"]
 
+        # Read the environment once: a snapshot when it will be scanned for overrides
+        if env is None:
+            env = _ACTIVE_ENV.get()
+        environ: Mapping[str, str]
+        if env is not None:
+            environ = env
+        else:
+            environ = dict(os.environ) if "env" in source_order else os.environ
+
         # Determine verbosity and color options from ENV/CLI
-        env_verbosity = os.getenv("CONFEE_VERBOSITY")
-        env_quiet = os.getenv("CONFEE_QUIET")
-        no_color_env = os.getenv("NO_COLOR") or os.getenv("CONFEE_NO_COLOR")
+        env_verbosity = environ.get("CONFEE_VERBOSITY")
+        env_quiet = environ.get("CONFEE_QUIET")
+        no_color_env = environ.get("NO_COLOR") or environ.get("CONFEE_NO_COLOR")
 
         verbose_flag = False
         quiet_flag = False
@@ -496,17 +687,32 @@ class OverrideHandler:
 
         # Load from environment variables if in source order
         if "env" in source_order:
-            configs_by_source["env"] = OverrideHandler.get_env_overrides(prefix=env_prefix)
+            configs_by_source["env"] = OverrideHandler.get_env_overrides(
+                prefix=env_prefix, env=environ
+            )
 
         # Parse CLI arguments if in source order
-        if "cli" in source_order:
+        if "cli" in source_order and filtered_cli_args:
             configs_by_source["cli"] = OverrideHandler.parse_overrides(filtered_cli_args)
 
-        merged_config: Dict[str, Any] = {}
+        # Pydantic drops unknown keys when extra="ignore", so env/CLI keys that cannot
+        # reach any field are pruned up front instead of being flattened and merged
+        accepted_keys = None
+        if config_class.model_config.get("extra", "ignore") == "ignore":
+            accepted_keys = _accepted_top_level_keys(config_class)
+
+        # Every source dict is freshly built above, so they can be folded in place
+        ordered_sources: List[Dict[str, Any]] = []
         for source in reversed(source_order):
             source_config = configs_by_source[source]
-            nested_config = OverrideHandler._flatten_to_nested(source_config)
-            merged_config = OverrideHandler._deep_merge(merged_config, nested_config)
+            if accepted_keys is not None and source in ("env", "cli"):
+                source_config = {
+                    key: value
+                    for key, value in source_config.items()
+                    if key.partition(".")[0] in accepted_keys
+                }
+            ordered_sources.append(source_config)
+        merged_config = OverrideHandler._fold_sources(ordered_sources)
 
         try:
             return config_class(**merged_config)
@@ -121,6 +121,19 @@ class TestFreezeBasics:
         config.name = "changed"  # Should work
         assert config.name == "changed"
 
+    def test_frozen_registry_released_with_instance(self):
+        """Test that frozen instances stay weak-referenceable and are released."""
+        import gc
+
+        config = SimpleConfig(name="test", value=42).freeze()
+        config_id = id(config)
+        assert config_id in ConfigBase._frozen_instances
+
+        del config
+        gc.collect()
+
+        assert config_id not in ConfigBase._frozen_instances
+
 
 class TestCopyUnfrozen:
     """Test copy_unfrozen() functionality."""
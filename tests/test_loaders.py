@@ -54,6 +54,36 @@ class TestConfigLoader:
         finally:
             Path(temp_path).unlink()
 
+    def test_load_yaml_cache_returns_independent_copies(self, tmp_path):
+        """Test that cached YAML data cannot be mutated through a returned dict."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("database:\n  host: localhost\n")
+
+        first = ConfigLoader.load_yaml(config_path)
+        first["database"]["host"] = "mutated"
+        second = ConfigLoader.load_yaml(config_path)
+
+        assert second == {"database": {"host": "localhost"}}
+
+    def test_load_yaml_cache_detects_file_changes(self, tmp_path):
+        """Test that a rewritten YAML file is parsed again."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("name: first\n")
+        assert ConfigLoader.load_yaml(config_path) == {"name": "first"}
+
+        config_path.write_text("name: second_value\n")
+        assert ConfigLoader.load_yaml(config_path) == {"name": "second_value"}
+
+    def test_load_yaml_clear_cache(self, tmp_path):
+        """Test that clearing the cache still allows loading."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("name: cached\n")
+        ConfigLoader.load_yaml(config_path)
+
+        ConfigLoader.clear_cache()
+
+        assert ConfigLoader.load_yaml(config_path) == {"name": "cached"}
+
     def test_load_json_file(self):
         """Test loading JSON file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
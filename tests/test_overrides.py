@@ -42,6 +42,15 @@ class TestParseOverrideString:
         with pytest.raises(ValueError):
             OverrideHandler.parse_override_string("no_equals_sign")
 
+    def test_parse_empty_key_raises(self):
+        """Test that an override without a key is rejected."""
+        with pytest.raises(ValueError, match="Invalid override format"):
+            OverrideHandler.parse_override_string("  =value")
+
+    def test_parse_empty_value_allowed(self):
+        """Test that an empty value is kept as an empty string."""
+        assert OverrideHandler.parse_override_string("name=") == ("name", "")
+
 
 class TestParseOverrides:
     """Test parsing multiple override strings."""
@@ -79,6 +88,13 @@ class TestValueCoercion:
         assert OverrideHandler.coerce_value("no", bool) is False
         assert OverrideHandler.coerce_value("off", bool) is False
 
+    def test_coerce_to_bool_short_tokens(self):
+        """Test coercion of single-letter boolean tokens."""
+        assert OverrideHandler.coerce_value("Y", bool) is True
+        assert OverrideHandler.coerce_value("t", bool) is True
+        assert OverrideHandler.coerce_value("n", bool) is False
+        assert OverrideHandler.coerce_value("F", bool) is False
+
     def test_coerce_to_bool_invalid(self):
         """Test coercion to boolean with invalid values."""
         with pytest.raises(ValueError):
@@ -98,6 +114,12 @@ class TestValueCoercion:
         """Test coercion to string."""
         assert OverrideHandler.coerce_value("hello", str) == "hello"
 
+    def test_coerce_to_other_type_calls_constructor(self):
+        """Test that types outside the coercion table are called directly."""
+        from pathlib import Path
+
+        assert OverrideHandler.coerce_value("/tmp/app", Path) == Path("/tmp/app")
+
 
 class TestApplyOverrides:
     """Test applying overrides to configuration."""
@@ -150,53 +172,190 @@ class TestApplyOverrides:
         with pytest.raises(KeyError):
             OverrideHandler.apply_overrides(config, overrides, strict=True)
 
+    def test_apply_empty_overrides_returns_same_instance(self):
+        """Test that applying no overrides skips rebuilding the config."""
+        config = SampleConfig(name="test")
+
+        assert OverrideHandler.apply_overrides(config, {}) is config
+
+    def test_apply_empty_overrides_to_frozen_returns_unfrozen_copy(self):
+        """Test that a frozen config is rebuilt even without overrides."""
+        config = SampleConfig(name="test").freeze()
+
+        updated = OverrideHandler.apply_overrides(config, {})
+
+        assert updated is not config
+        assert updated.name == "test"
+        assert not updated.is_frozen()
+        assert config.is_frozen()
+
+    def test_apply_overrides_validates_uncoerced_fields(self):
+        """Test that overridden values are validated when the config is rebuilt."""
+        from typing import Literal
+
+        from pydantic import ValidationError
+
+        class ModeConfig(ConfigBase):
+            mode: Literal["fast", "safe"] = "safe"
+
+        assert OverrideHandler.apply_overrides(ModeConfig(), {"mode": "fast"}).mode == "fast"
+        with pytest.raises(ValidationError):
+            OverrideHandler.apply_overrides(ModeConfig(), {"mode": "reckless"})
+
+    def test_apply_override_optional_field_uses_declared_type(self):
+        """Test that Optional fields defaulting to None are coerced to the declared type."""
+
+        class OptionalConfig(ConfigBase):
+            verbose: bool | None = None
+
+        updated = OverrideHandler.apply_overrides(OptionalConfig(), {"verbose": "off"})
+
+        assert updated.verbose is False
+
+    def test_apply_override_nested_uses_field_plan(self):
+        """Test that nested ConfigBase fields are coerced from their declared types."""
+        config = NestedAppConfig()
+        overrides = {"database.port": "3306", "auth.enabled": "no"}
+
+        updated = OverrideHandler.apply_overrides(config, overrides)
+
+        assert updated.database.port == 3306
+        assert updated.auth.enabled is False
+
 
 class TestGetEnvOverrides:
     """Test getting overrides from environment variables."""
 
-    def test_get_env_overrides_default_prefix(self):
+    def test_get_env_overrides_default_prefix(self, monkeypatch):
         """Test getting overrides with default CONFEE_ prefix."""
-        os.environ["CONFEE_DEBUG"] = "true"
-        os.environ["CONFEE_WORKERS"] = "8"
-        os.environ["OTHER_VAR"] = "ignored"
+        monkeypatch.setenv("CONFEE_DEBUG", "true")
+        monkeypatch.setenv("CONFEE_WORKERS", "8")
+        monkeypatch.setenv("OTHER_VAR", "ignored")
 
-        try:
-            overrides = OverrideHandler.get_env_overrides()
+        overrides = OverrideHandler.get_env_overrides()
 
-            assert "debug" in overrides
-            assert overrides["debug"] == "true"
-            assert "workers" in overrides
-            assert overrides["workers"] == "8"
-            assert "other_var" not in overrides
-        finally:
-            del os.environ["CONFEE_DEBUG"]
-            del os.environ["CONFEE_WORKERS"]
-            del os.environ["OTHER_VAR"]
+        assert "debug" in overrides
+        assert overrides["debug"] == "true"
+        assert "workers" in overrides
+        assert overrides["workers"] == "8"
+        assert "other_var" not in overrides
 
-    def test_get_env_overrides_custom_prefix(self):
+    def test_get_env_overrides_custom_prefix(self, monkeypatch):
         """Test getting overrides with custom prefix."""
-        os.environ["MYAPP_DEBUG"] = "false"
-        os.environ["MYAPP_NAME"] = "test"
+        monkeypatch.setenv("MYAPP_DEBUG", "false")
+        monkeypatch.setenv("MYAPP_NAME", "test")
 
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
 
-            assert overrides["debug"] == "false"
-            assert overrides["name"] == "test"
-        finally:
-            del os.environ["MYAPP_DEBUG"]
-            del os.environ["MYAPP_NAME"]
+        assert overrides["debug"] == "false"
+        assert overrides["name"] == "test"
 
-    def test_get_env_overrides_empty(self):
+    def test_get_env_overrides_empty(self, monkeypatch):
         """Test getting env overrides when no matching variables exist."""
         # Make sure no CONFEE_ variables exist
         for key in list(os.environ.keys()):
             if key.startswith("CONFEE_"):
-                del os.environ[key]
+                monkeypatch.delenv(key)
 
         overrides = OverrideHandler.get_env_overrides()
         assert overrides == {} or all(not v.startswith("CONFEE_") for v in os.environ)
 
+    def test_get_env_overrides_multiple_prefixes(self, monkeypatch):
+        """Test that a tuple of prefixes is matched in a single scan."""
+        monkeypatch.setenv("MYAPP_DEBUG", "true")
+        monkeypatch.setenv("LEGACY_DATABASE__HOST", "db")
+        monkeypatch.setenv("OTHER_NAME", "ignored")
+
+        overrides = OverrideHandler.get_env_overrides(prefix=("MYAPP_", "LEGACY_"))
+
+        assert overrides == {"debug": "true", "database.host": "db"}
+
+    def test_get_env_overrides_from_snapshot(self, monkeypatch):
+        """Test scanning an explicit environment snapshot instead of os.environ."""
+        monkeypatch.setenv("SNAP_NAME", "live")
+        snapshot = {"SNAP_NAME": "snapshot", "SNAP_DATABASE__PORT": "3306"}
+
+        overrides = OverrideHandler.get_env_overrides(prefix="SNAP_", env=snapshot)
+
+        assert overrides == {"name": "snapshot", "database.port": "3306"}
+
+    def test_get_env_overrides_tracks_env_changes(self, monkeypatch):
+        """Test that each call reflects the current environment."""
+        monkeypatch.setenv("TRACK_DEBUG", "true")
+        assert OverrideHandler.get_env_overrides(prefix="TRACK_") == {"debug": "true"}
+
+        monkeypatch.setenv("TRACK_DEBUG", "false")
+        assert OverrideHandler.get_env_overrides(prefix="TRACK_") == {"debug": "false"}
+
+        monkeypatch.delenv("TRACK_DEBUG")
+        assert OverrideHandler.get_env_overrides(prefix="TRACK_") == {}
+
+    def test_get_env_override_keys_are_interned(self, monkeypatch):
+        """Test that converted keys are shared across scans."""
+        import sys
+
+        from confee.overrides import _env_key_to_config_key
+
+        monkeypatch.setenv("INTERN_DATABASE__HOST", "db")
+        first = next(iter(OverrideHandler.get_env_overrides(prefix="INTERN_")))
+        _env_key_to_config_key.cache_clear()
+        second = next(iter(OverrideHandler.get_env_overrides(prefix="INTERN_")))
+
+        assert first is second
+        assert first is sys.intern("database.host")
+
+
+class TestExplicitEnvironment:
+    """Test reading overrides from a mapping instead of os.environ."""
+
+    def test_parse_with_env_mapping(self, monkeypatch):
+        """Test that parse() reads only the given env mapping."""
+        monkeypatch.setenv("CONFEE_NAME", "from_os_environ")
+
+        config = OverrideHandler.parse(
+            SampleConfig,
+            cli_args=[],
+            env={"CONFEE_NAME": "from_mapping", "CONFEE_WORKERS": "8"},
+        )
+
+        assert config.name == "from_mapping"
+        assert config.workers == 8
+
+    def test_with_env_context_manager(self, monkeypatch):
+        """Test that with_env() scopes the mapping to the block."""
+        monkeypatch.setenv("CONFEE_NAME", "from_os_environ")
+
+        with OverrideHandler.with_env({"CONFEE_NAME": "scoped"}) as env:
+            assert env == {"CONFEE_NAME": "scoped"}
+            assert OverrideHandler.get_env_overrides() == {"name": "scoped"}
+            config = OverrideHandler.parse(SampleConfig, cli_args=[])
+            assert config.name == "scoped"
+
+        assert OverrideHandler.get_env_overrides()["name"] == "from_os_environ"
+
+    def test_with_env_is_isolated_per_thread(self):
+        """Test that with_env() in one thread does not leak into another."""
+        import threading
+
+        seen = {}
+        inside = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            with OverrideHandler.with_env({"ISOLATED_NAME": "worker"}):
+                inside.set()
+                release.wait(timeout=5)
+                seen["worker"] = OverrideHandler.get_env_overrides(prefix="ISOLATED_")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inside.wait(timeout=5)
+        seen["main"] = OverrideHandler.get_env_overrides(prefix="ISOLATED_")
+        release.set()
+        thread.join()
+
+        assert seen == {"worker": {"name": "worker"}, "main": {}}
+
 
 class TestFromCliAndEnv:
     """Test creating config from CLI and environment variables."""
@@ -211,35 +370,37 @@ class TestFromCliAndEnv:
         assert config.debug is True
         assert config.workers == 4  # default
 
-    def test_from_cli_and_env_env_only(self):
+    def test_from_cli_and_env_env_only(self, monkeypatch):
         """Test creating config from environment variables only."""
-        os.environ["CONFEE_NAME"] = "env_app"
-        os.environ["CONFEE_DEBUG"] = "true"
+        monkeypatch.setenv("CONFEE_NAME", "env_app")
+        monkeypatch.setenv("CONFEE_DEBUG", "true")
 
-        try:
-            config = OverrideHandler.from_cli_and_env(SampleConfig, env_prefix="CONFEE_")
+        config = OverrideHandler.from_cli_and_env(SampleConfig, env_prefix="CONFEE_")
 
-            assert config.name == "env_app"
-            assert config.debug is True
-        finally:
-            del os.environ["CONFEE_NAME"]
-            del os.environ["CONFEE_DEBUG"]
+        assert config.name == "env_app"
+        assert config.debug is True
 
-    def test_from_cli_and_env_cli_overrides_env(self):
+    def test_from_cli_and_env_cli_overrides_env(self, monkeypatch):
         """Test that CLI arguments override environment variables."""
-        os.environ["CONFEE_NAME"] = "env_app"
-        os.environ["CONFEE_DEBUG"] = "false"
+        monkeypatch.setenv("CONFEE_NAME", "env_app")
+        monkeypatch.setenv("CONFEE_DEBUG", "false")
 
-        try:
-            config = OverrideHandler.from_cli_and_env(
-                SampleConfig, cli_overrides=["debug=true"], env_prefix="CONFEE_"
-            )
+        config = OverrideHandler.from_cli_and_env(
+            SampleConfig, cli_overrides=["debug=true"], env_prefix="CONFEE_"
+        )
 
-            assert config.name == "env_app"  # From env
-            assert config.debug is True  # From CLI (overrides env)
-        finally:
-            del os.environ["CONFEE_NAME"]
-            del os.environ["CONFEE_DEBUG"]
+        assert config.name == "env_app"  # From env
+        assert config.debug is True  # From CLI (overrides env)
+
+    def test_from_cli_and_env_ignores_unrelated_env_vars(self, monkeypatch):
+        """Test that conflicting env vars for unknown fields are ignored."""
+        monkeypatch.setenv("PX_NAME", "envapp")
+        monkeypatch.setenv("PX_LOG", "1")
+        monkeypatch.setenv("PX_LOG__LEVEL", "debug")
+
+        config = OverrideHandler.from_cli_and_env(SampleConfig, env_prefix="PX_")
+
+        assert config.name == "envapp"
 
     def test_from_cli_and_env_explicit_env_dict(self):
         """Test using explicit env overrides dictionary."""
@@ -254,28 +415,23 @@ class TestFromCliAndEnv:
 class TestOverridePriority:
     """Test override priority order."""
 
-    def test_priority_cli_over_env(self):
+    def test_priority_cli_over_env(self, monkeypatch):
         """Test that CLI overrides take precedence over environment."""
-        os.environ["CONFEE_NAME"] = "env_app"
-        os.environ["CONFEE_DEBUG"] = "false"
-        os.environ["CONFEE_WORKERS"] = "4"
+        monkeypatch.setenv("CONFEE_NAME", "env_app")
+        monkeypatch.setenv("CONFEE_DEBUG", "false")
+        monkeypatch.setenv("CONFEE_WORKERS", "4")
 
-        try:
-            config = OverrideHandler.from_cli_and_env(
-                SampleConfig,
-                cli_overrides=["debug=true"],  # Higher priority
-                env_prefix="CONFEE_",
-            )
+        config = OverrideHandler.from_cli_and_env(
+            SampleConfig,
+            cli_overrides=["debug=true"],  # Higher priority
+            env_prefix="CONFEE_",
+        )
 
-            # CLI override wins
-            assert config.debug is True
-            # Env values used where no CLI override
-            assert config.name == "env_app"
-            assert config.workers == 4
-        finally:
-            del os.environ["CONFEE_NAME"]
-            del os.environ["CONFEE_DEBUG"]
-            del os.environ["CONFEE_WORKERS"]
+        # CLI override wins
+        assert config.debug is True
+        # Env values used where no CLI override
+        assert config.name == "env_app"
+        assert config.workers == 4
 
 
 class TestOverrideMatrix:
@@ -292,6 +448,7 @@ class TestOverrideMatrix:
         with pytest.raises(ValueError) as ei:
             OverrideHandler.coerce_value("maybe", bool)
         assert "Cannot coerce 'maybe' to bool" in str(ei.value)
+        assert "y/t" in str(ei.value) and "n/f" in str(ei.value)
 
     def test_parse_non_strict_missing_file_emits_warning_and_uses_cli(self, tmp_path):
         """Test that missing config file emits warning in non-strict mode and uses CLI values."""
@@ -378,48 +535,32 @@ class NestedAppConfig(ConfigBase):
 class TestDoubleUnderscoreEnvVar:
     """Test double underscore (__) to dot conversion for nested env vars."""
 
-    def test_env_double_underscore_converts_to_dot(self):
-        os.environ["MYAPP_DATABASE__HOST"] = "prod.db"
-        os.environ["MYAPP_DATABASE__PORT"] = "3306"
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
-            assert overrides["database.host"] == "prod.db"
-            assert overrides["database.port"] == "3306"
-        finally:
-            del os.environ["MYAPP_DATABASE__HOST"]
-            del os.environ["MYAPP_DATABASE__PORT"]
+    def test_env_double_underscore_converts_to_dot(self, monkeypatch):
+        monkeypatch.setenv("MYAPP_DATABASE__HOST", "prod.db")
+        monkeypatch.setenv("MYAPP_DATABASE__PORT", "3306")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        assert overrides["database.host"] == "prod.db"
+        assert overrides["database.port"] == "3306"
 
-    def test_env_single_underscore_preserved(self):
-        os.environ["MYAPP_SECRET_KEY"] = "abc123"
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
-            assert overrides["secret_key"] == "abc123"
-        finally:
-            del os.environ["MYAPP_SECRET_KEY"]
+    def test_env_single_underscore_preserved(self, monkeypatch):
+        monkeypatch.setenv("MYAPP_SECRET_KEY", "abc123")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        assert overrides["secret_key"] == "abc123"
 
-    def test_env_mixed_underscore_patterns(self):
-        os.environ["MYAPP_AUTH__CLIENT_SECRET"] = "secret123"
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
-            assert overrides["auth.client_secret"] == "secret123"
-        finally:
-            del os.environ["MYAPP_AUTH__CLIENT_SECRET"]
+    def test_env_mixed_underscore_patterns(self, monkeypatch):
+        monkeypatch.setenv("MYAPP_AUTH__CLIENT_SECRET", "secret123")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        assert overrides["auth.client_secret"] == "secret123"
 
-    def test_env_triple_underscore_converts_correctly(self):
-        os.environ["MYAPP_A___B"] = "value"
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
-            assert overrides["a._b"] == "value"
-        finally:
-            del os.environ["MYAPP_A___B"]
+    def test_env_triple_underscore_converts_correctly(self, monkeypatch):
+        monkeypatch.setenv("MYAPP_A___B", "value")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        assert overrides["a._b"] == "value"
 
-    def test_env_deep_nesting(self):
-        os.environ["MYAPP_A__B__C__D"] = "deep"
-        try:
-            overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
-            assert overrides["a.b.c.d"] == "deep"
-        finally:
-            del os.environ["MYAPP_A__B__C__D"]
+    def test_env_deep_nesting(self, monkeypatch):
+        monkeypatch.setenv("MYAPP_A__B__C__D", "deep")
+        overrides = OverrideHandler.get_env_overrides(prefix="MYAPP_")
+        assert overrides["a.b.c.d"] == "deep"
 
 
 class TestDeepMerge:
@@ -449,11 +590,25 @@ class TestDeepMerge:
         result = OverrideHandler._deep_merge(base, override)
         assert result == {"a": {"x": 1}}
 
+    def test_deep_merge_does_not_mutate_inputs(self):
+        base = {"a": {"x": 1}}
+        override = {"a": {"y": 2}}
+        OverrideHandler._deep_merge(base, override)
+        assert base == {"a": {"x": 1}}
+        assert override == {"a": {"y": 2}}
+
+    def test_deep_merge_inplace_mutates_base(self):
+        base = {"a": {"x": 1, "y": 2}, "b": 3}
+        override = {"a": {"y": 20, "z": 30}, "c": 4}
+        result = OverrideHandler._deep_merge_inplace(base, override)
+        assert result is base
+        assert base == {"a": {"x": 1, "y": 20, "z": 30}, "b": 3, "c": 4}
+
 
 class TestFileEnvMergeIntegration:
     """Test merging file config (nested) with env config (flat) - the bug fix."""
 
-    def test_file_and_env_merge_no_conflict(self, tmp_path):
+    def test_file_and_env_merge_no_conflict(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: myapp
@@ -463,27 +618,23 @@ database:
 auth:
   enabled: true
 """)
-        os.environ["TEST_DATABASE__PASSWORD"] = "secret123"
-        os.environ["TEST_AUTH__SECRET"] = "my_secret"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["file", "env"],
-            )
-            assert config.name == "myapp"
-            assert config.database.host == "localhost"
-            assert config.database.port == 5432
-            assert config.database.password == "secret123"
-            assert config.auth.enabled is True
-            assert config.auth.secret == "my_secret"
-        finally:
-            del os.environ["TEST_DATABASE__PASSWORD"]
-            del os.environ["TEST_AUTH__SECRET"]
-
-    def test_env_overrides_file_values(self, tmp_path):
+        monkeypatch.setenv("TEST_DATABASE__PASSWORD", "secret123")
+        monkeypatch.setenv("TEST_AUTH__SECRET", "my_secret")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["file", "env"],
+        )
+        assert config.name == "myapp"
+        assert config.database.host == "localhost"
+        assert config.database.port == 5432
+        assert config.database.password == "secret123"
+        assert config.auth.enabled is True
+        assert config.auth.secret == "my_secret"
+
+    def test_env_overrides_file_values(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: myapp
@@ -491,23 +642,19 @@ database:
   host: localhost
   port: 5432
 """)
-        os.environ["TEST_DATABASE__HOST"] = "prod.db"
-        os.environ["TEST_DATABASE__PORT"] = "3306"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["env", "file"],
-            )
-            assert config.database.host == "prod.db"
-            assert config.database.port == 3306
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
-            del os.environ["TEST_DATABASE__PORT"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "prod.db")
+        monkeypatch.setenv("TEST_DATABASE__PORT", "3306")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["env", "file"],
+        )
+        assert config.database.host == "prod.db"
+        assert config.database.port == 3306
 
-    def test_file_overrides_env_values(self, tmp_path):
+    def test_file_overrides_env_values(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: myapp
@@ -515,23 +662,19 @@ database:
   host: file.db
   port: 5432
 """)
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        os.environ["TEST_DATABASE__PORT"] = "3306"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["file", "env"],
-            )
-            assert config.database.host == "file.db"
-            assert config.database.port == 5432
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
-            del os.environ["TEST_DATABASE__PORT"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        monkeypatch.setenv("TEST_DATABASE__PORT", "3306")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["file", "env"],
+        )
+        assert config.database.host == "file.db"
+        assert config.database.port == 5432
 
-    def test_cli_overrides_env_and_file(self, tmp_path):
+    def test_cli_overrides_env_and_file(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: myapp
@@ -539,58 +682,49 @@ database:
   host: localhost
   port: 5432
 """)
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=["database.host=cli.db"],
-                env_prefix="TEST_",
-                source_order=["cli", "env", "file"],
-            )
-            assert config.database.host == "cli.db"
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=["database.host=cli.db"],
+            env_prefix="TEST_",
+            source_order=["cli", "env", "file"],
+        )
+        assert config.database.host == "cli.db"
 
-    def test_source_order_file_env_priority(self, tmp_path):
+    def test_source_order_file_env_priority(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 database:
   host: file.db
 """)
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["file", "env"],
-            )
-            assert config.database.host == "file.db"
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["file", "env"],
+        )
+        assert config.database.host == "file.db"
 
-    def test_source_order_env_file_priority(self, tmp_path):
+    def test_source_order_env_file_priority(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 database:
   host: file.db
 """)
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["env", "file"],
-            )
-            assert config.database.host == "env.db"
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["env", "file"],
+        )
+        assert config.database.host == "env.db"
 
-    def test_multiple_nested_sections_merge(self, tmp_path):
+    def test_multiple_nested_sections_merge(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: myapp
@@ -600,52 +734,121 @@ database:
 auth:
   enabled: false
 """)
-        os.environ["TEST_DATABASE__PORT"] = "3306"
-        os.environ["TEST_DATABASE__PASSWORD"] = "secret"
-        os.environ["TEST_AUTH__ENABLED"] = "true"
-        os.environ["TEST_AUTH__SECRET"] = "jwt_secret"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["file", "env"],
-            )
-            assert config.name == "myapp"
-            assert config.database.host == "localhost"
-            assert config.database.port == 3306
-            assert config.database.username == "admin"
-            assert config.database.password == "secret"
-            assert config.auth.enabled is False
-            assert config.auth.secret == "jwt_secret"
-        finally:
-            del os.environ["TEST_DATABASE__PORT"]
-            del os.environ["TEST_DATABASE__PASSWORD"]
-            del os.environ["TEST_AUTH__ENABLED"]
-            del os.environ["TEST_AUTH__SECRET"]
-
-    def test_env_only_no_file(self):
-        os.environ["TEST_NAME"] = "envapp"
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        os.environ["TEST_DATABASE__PORT"] = "5433"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=None,
-                cli_args=[],
-                env_prefix="TEST_",
-                source_order=["env"],
-            )
-            assert config.name == "envapp"
-            assert config.database.host == "env.db"
-            assert config.database.port == 5433
-        finally:
-            del os.environ["TEST_NAME"]
-            del os.environ["TEST_DATABASE__HOST"]
-            del os.environ["TEST_DATABASE__PORT"]
+        monkeypatch.setenv("TEST_DATABASE__PORT", "3306")
+        monkeypatch.setenv("TEST_DATABASE__PASSWORD", "secret")
+        monkeypatch.setenv("TEST_AUTH__ENABLED", "true")
+        monkeypatch.setenv("TEST_AUTH__SECRET", "jwt_secret")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["file", "env"],
+        )
+        assert config.name == "myapp"
+        assert config.database.host == "localhost"
+        assert config.database.port == 3306
+        assert config.database.username == "admin"
+        assert config.database.password == "secret"
+        assert config.auth.enabled is False
+        assert config.auth.secret == "jwt_secret"
+
+    def test_env_only_no_file(self, monkeypatch):
+        monkeypatch.setenv("TEST_NAME", "envapp")
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        monkeypatch.setenv("TEST_DATABASE__PORT", "5433")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=None,
+            cli_args=[],
+            env_prefix="TEST_",
+            source_order=["env"],
+        )
+        assert config.name == "envapp"
+        assert config.database.host == "env.db"
+        assert config.database.port == 5433
+
+    def test_unrelated_env_vars_are_ignored(self, monkeypatch):
+        """Env vars that match no field are pruned before flattening."""
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        # Conflicting unrelated keys would otherwise fail while flattening
+        monkeypatch.setenv("TEST_UNRELATED", "scalar")
+        monkeypatch.setenv("TEST_UNRELATED__CHILD", "nested")
+
+        config = OverrideHandler.parse(
+            NestedAppConfig, cli_args=[], env_prefix="TEST_", source_order=["env"]
+        )
+
+        assert config.database.host == "env.db"
+
+    def test_env_keys_matching_field_alias_are_kept(self, monkeypatch):
+        """Env vars addressing a field through its alias still apply."""
+        from pydantic import Field
+
+        class AliasedConfig(ConfigBase):
+            service_name: str = Field("default", alias="service")
+
+        monkeypatch.setenv("TEST_SERVICE", "from_env")
+
+        config = OverrideHandler.parse(
+            AliasedConfig, cli_args=[], env_prefix="TEST_", source_order=["env"]
+        )
+
+        assert config.service_name == "from_env"
+
+    def test_keys_remapped_by_before_validator_are_kept(self, monkeypatch):
+        """Env/CLI keys consumed by a before model validator still apply."""
+        from pydantic import model_validator
 
-    def test_all_three_sources_merge(self, tmp_path):
+        class LegacyConfig(ConfigBase):
+            name: str = "default"
+
+            @model_validator(mode="before")
+            @classmethod
+            def _rename_legacy(cls, data):
+                if isinstance(data, dict) and "old_name" in data:
+                    data = {**data, "name": data.pop("old_name")}
+                return data
+
+        config = OverrideHandler.parse(
+            LegacyConfig, cli_args=["old_name=fromcli"], source_order=["cli"]
+        )
+        assert config.name == "fromcli"
+
+        monkeypatch.setenv("TEST_OLD_NAME", "fromenv")
+        config = OverrideHandler.parse(
+            LegacyConfig, cli_args=[], env_prefix="TEST_", source_order=["env"]
+        )
+        assert config.name == "fromenv"
+
+    def test_nested_before_validator_keeps_pruning(self, monkeypatch):
+        """Env vars for unknown fields are pruned even if a nested model remaps keys."""
+        from pydantic import model_validator
+
+        class InnerConfig(ConfigBase):
+            host: str = "localhost"
+
+            @model_validator(mode="before")
+            @classmethod
+            def _rename_legacy(cls, data):
+                if isinstance(data, dict) and "hostname" in data:
+                    data = {**data, "host": data.pop("hostname")}
+                return data
+
+        class OuterConfig(ConfigBase):
+            inner: InnerConfig = InnerConfig()
+
+        monkeypatch.setenv("TEST_INNER__HOSTNAME", "env.db")
+        monkeypatch.setenv("TEST_UNRELATED", "scalar")
+        monkeypatch.setenv("TEST_UNRELATED__CHILD", "nested")
+
+        config = OverrideHandler.parse(
+            OuterConfig, cli_args=[], env_prefix="TEST_", source_order=["env"]
+        )
+
+        assert config.inner.host == "env.db"
+
+    def test_all_three_sources_merge(self, tmp_path, monkeypatch):
         config_file = tmp_path / "config.yaml"
         config_file.write_text("""
 name: fileapp
@@ -658,23 +861,19 @@ auth:
   enabled: false
   secret: file_secret
 """)
-        os.environ["TEST_DATABASE__HOST"] = "env.db"
-        os.environ["TEST_AUTH__ENABLED"] = "true"
-        try:
-            config = OverrideHandler.parse(
-                NestedAppConfig,
-                config_file=str(config_file),
-                cli_args=["database.port=9999", "auth.secret=cli_secret"],
-                env_prefix="TEST_",
-                source_order=["cli", "env", "file"],
-            )
-            assert config.name == "fileapp"
-            assert config.database.host == "env.db"
-            assert config.database.port == 9999
-            assert config.database.username == "file_user"
-            assert config.database.password == "file_pass"
-            assert config.auth.enabled is True
-            assert config.auth.secret == "cli_secret"
-        finally:
-            del os.environ["TEST_DATABASE__HOST"]
-            del os.environ["TEST_AUTH__ENABLED"]
+        monkeypatch.setenv("TEST_DATABASE__HOST", "env.db")
+        monkeypatch.setenv("TEST_AUTH__ENABLED", "true")
+        config = OverrideHandler.parse(
+            NestedAppConfig,
+            config_file=str(config_file),
+            cli_args=["database.port=9999", "auth.secret=cli_secret"],
+            env_prefix="TEST_",
+            source_order=["cli", "env", "file"],
+        )
+        assert config.name == "fileapp"
+        assert config.database.host == "env.db"
+        assert config.database.port == 9999
+        assert config.database.username == "file_user"
+        assert config.database.password == "file_pass"
+        assert config.auth.enabled is True
+        assert config.auth.secret == "cli_secret"